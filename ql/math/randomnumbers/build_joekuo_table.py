@@ -0,0 +1,17 @@
+"""
+Builds data/joekuo_d5.bin, the JoeKuoD5 direction integer initializers and
+primitive polynomials that sobolrsg.py loads at runtime, from sobolrsg.cpp and
+primitivepolynomials.cpp.
+
+Run it again whenever the tables in the C++ sources change:
+
+    python build_joekuo_table.py
+"""
+from sobolrsg import JOE_KUO_D5_ASSET, pack_joe_kuo_d5_asset, parse_joe_kuo_d5_sources
+
+if __name__ == "__main__":
+    tables = parse_joe_kuo_d5_sources()
+    JOE_KUO_D5_ASSET.parent.mkdir(exist_ok=True)
+    JOE_KUO_D5_ASSET.write_bytes(pack_joe_kuo_d5_asset(tables))
+    print(f"Wrote {JOE_KUO_D5_ASSET}: {len(tables['init'])} dimensions, "
+          f"{JOE_KUO_D5_ASSET.stat().st_size} bytes")
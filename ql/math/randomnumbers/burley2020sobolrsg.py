@@ -0,0 +1,193 @@
+"""
+NumPy port of QuantLib's Burley2020SobolRsg (see burley2020sobolrsg.hpp/.cpp):
+Sobol sequence with hash-based Owen scrambling.
+
+Reference: Brent Burley: Practical Hash-based Owen Scrambling, Journal of
+Computer Graphics Techniques, Vol. 9, No. 4, 2020.
+
+Every step of the scrambling is plain 32-bit integer arithmetic, so draw(n)
+scrambles a whole (n, dimensionality) batch with a handful of array operations.
+"""
+import random
+
+import numpy as np
+
+from sobolrsg import (MAX_DIMENSIONALITY, NORMALIZATION_FACTOR, bit_major_directions, float_conversion,
+                     output_array, segment_table_lookup, segment_tables)
+
+# Largest value of the 32-bit point counter
+MAX_SEQUENCE_COUNTER = 0xFFFFFFFF
+
+# Number of integers scrambled at a time by draw_int32()
+SCRAMBLE_BLOCK_SIZE = 1 << 15
+
+_MASK64 = (1 << 64) - 1
+
+
+def mersenne_twister_int32(seed, count):
+    """
+    Returns the first count outputs of MersenneTwisterUniformRng(seed).nextInt32(),
+    i.e. MT19937 seeded with init_genrand.
+    """
+    state = [seed & 0xFFFFFFFF]
+    for i in range(1, 624):
+        previous = state[-1]
+        state.append((1812433253 * (previous ^ (previous >> 30)) + i) & 0xFFFFFFFF)
+    # position 624 makes Python's MT19937 regenerate the state before the first output
+    rng = random.Random()
+    rng.setstate((3, tuple(state) + (624,), None))
+    return [rng.getrandbits(32) for _ in range(count)]
+
+
+_REVERSE_BITS_STAGES = [
+    # (shift, mask of the bits moved down)
+    (16, 0xFFFF0000),
+    (8, 0xFF00FF00),
+    (4, 0xF0F0F0F0),
+    (2, 0xCCCCCCCC),
+    (1, 0xAAAAAAAA),
+]
+
+_LAINE_KARRAS_MULTIPLIERS = [0x6c50b47c, 0xb82f1e52, 0xc7afe638, 0x8d22f6e6]
+
+
+def reverse_bits(x):
+    """Reverses the bits of every uint32 in x (swap halves, bytes, nibbles, pairs, bits)."""
+    x = np.array(x, dtype=np.uint32)
+    low = np.empty_like(x)
+    for shift, mask in _REVERSE_BITS_STAGES:
+        # x = ((x & mask) >> shift) | ((x << shift) & mask), in place
+        np.bitwise_and(x, np.uint32(mask), out=low)
+        np.right_shift(low, np.uint32(shift), out=low)
+        np.left_shift(x, np.uint32(shift), out=x)
+        np.bitwise_and(x, np.uint32(mask), out=x)
+        np.bitwise_or(x, low, out=x)
+    return x
+
+
+def laine_karras_permutation(x, seed):
+    # uint32 arrays wrap around on overflow, as the C++ std::uint32_t arithmetic does
+    x = np.add(x, np.asarray(seed, dtype=np.uint32), dtype=np.uint32)
+    product = np.empty_like(x)
+    for multiplier in _LAINE_KARRAS_MULTIPLIERS:
+        np.multiply(x, np.uint32(multiplier), out=product)
+        np.bitwise_xor(x, product, out=x)
+    return x
+
+
+def nested_uniform_scramble(x, seed):
+    return reverse_bits(laine_karras_permutation(reverse_bits(x), seed))
+
+
+# boost hash_combine() as used by burley2020sobolrsg.cpp, on Python ints
+
+def _local_hash_mix(x):
+    m = 0xe9846af9b1a615d
+    x ^= x >> 32
+    x = (x * m) & _MASK64
+    x ^= x >> 32
+    x = (x * m) & _MASK64
+    x ^= x >> 28
+    return x
+
+
+def _local_hash(v):
+    seed = 0
+    seed = ((v >> 32) + _local_hash_mix(seed)) & _MASK64
+    seed = ((v & 0xFFFFFFFF) + _local_hash_mix(seed)) & _MASK64
+    return seed
+
+
+def _local_hash_combine(x, v):
+    return _local_hash_mix((x + 0x9e3779b9 + _local_hash(v)) & _MASK64)
+
+
+class Burley2020SobolRsg:
+    """
+    Scrambled Sobol sequence generator (Joe-Kuo D5 direction integers).
+
+    Point i is the Sobol point with the nested-uniform-scrambled index i,
+    each of its coordinates scrambled again with a per-dimension seed derived
+    from scramble_seed, as in the C++ implementation. Only the Joe-Kuo D5
+    direction integers are available in this port.
+    """
+
+    def __init__(self, dimensionality, scramble_seed=43):
+        if dimensionality <= 0:
+            raise ValueError("dimensionality must be greater than 0")
+        if dimensionality > MAX_DIMENSIONALITY:
+            raise ValueError(f"dimensionality {dimensionality} exceeds the number of "
+                             f"tabulated Joe-Kuo D5 dimensions ({MAX_DIMENSIONALITY})")
+
+        self._dimensionality = dimensionality
+        # bit-major, (BITS, dimensionality), a view of the table shared with SobolRsg
+        self._directions = bit_major_directions()[:, :dimensionality]
+        self._group4_seeds = mersenne_twister_int32(scramble_seed, (dimensionality - 1) // 4 + 1)
+        self._dimension_seeds = np.empty(dimensionality, dtype=np.uint32)
+        for i in range(dimensionality):
+            if i % 4 == 0:
+                seed = self._group4_seeds[i // 4]
+            seed = _local_hash_combine(seed, i % 4)
+            self._dimension_seeds[i] = seed & 0xFFFFFFFF
+        self._next_sequence_counter = 0
+        self._sequence = np.zeros(dimensionality, dtype=np.float64)
+        self._tables = None
+
+    def dimension(self):
+        return self._dimensionality
+
+    def skip_to(self, n):
+        """Returns the n-th integer point; the next draw is point n + 1."""
+        n = int(n)
+        if not 0 <= n < MAX_SEQUENCE_COUNTER:
+            raise ValueError(f"point {n} is outside the 32-bit sequence [0, {MAX_SEQUENCE_COUNTER})")
+        self._next_sequence_counter = n
+        return self.next_int32_sequence()
+
+    def next_int32_sequence(self):
+        return self.draw_int32(1)[0]
+
+    def next_sequence(self):
+        self._sequence = self.next_int32_sequence() * NORMALIZATION_FACTOR
+        return self._sequence.copy()
+
+    def last_sequence(self):
+        return self._sequence.copy()
+
+    def draw_int32(self, n, out=None):
+        """
+        Returns the next n integer points as an (n, dimensionality) uint32 array,
+        written into out if given.
+        """
+        if self._next_sequence_counter + n > MAX_SEQUENCE_COUNTER:
+            raise RuntimeError("period exceeded")
+        out = output_array((n, self._dimensionality), np.uint32, out)
+        counters = np.arange(self._next_sequence_counter, self._next_sequence_counter + n, dtype=np.uint32)
+        self._next_sequence_counter += n
+
+        # non Gray-code Sobol points at the scrambled indices: point k XORs the
+        # direction integers selected by the bits of k + 1 (SobolRsg::skipTo)
+        indices = nested_uniform_scramble(counters, self._group4_seeds[0]) + np.uint32(1)
+        if self._tables is None:
+            self._tables = segment_tables(self._directions)
+        # work through blocks of rows small enough to stay in cache across the
+        # dozens of elementwise passes of the scrambling
+        block = max(1, SCRAMBLE_BLOCK_SIZE // self._dimensionality)
+        for begin in range(0, n, block):
+            end = min(begin + block, n)
+            rows = out[begin:end]
+            segment_table_lookup(self._tables, indices[begin:end], rows)
+            rows[:] = nested_uniform_scramble(rows, self._dimension_seeds)
+        return out
+
+    def draw(self, n, dtype=np.float64, out=None):
+        """
+        Returns the next n points as an (n, dimensionality) array of float64
+        (default) or float32, see SobolRsg.draw() for dtype and out.
+        """
+        shift, factor = float_conversion(dtype)
+        out = output_array((n, self._dimensionality), dtype, out)
+        np.multiply(self.draw_int32(n) >> np.uint32(shift), factor, out=out)
+        if n:
+            self._sequence = out[-1].astype(np.float64)
+        return out
@@ -0,0 +1,958 @@
+"""
+NumPy port of QuantLib's SobolRsg (see sobolrsg.hpp/sobolrsg.cpp) using the
+Joe-Kuo D5 direction integers.
+
+Points can be drawn one at a time, mirroring the C++ interface, or in batches
+with draw(n), which advances every dimension with a single vectorised XOR per
+point (Antonov-Saleev Gray-code recurrence).
+"""
+import array
+import atexit
+import functools
+import re
+import sys
+import time
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import cupy
+except ImportError:
+    cupy = None
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+SOBOL_CPP_SOURCE = SCRIPT_DIR / "sobolrsg.cpp"
+PRIMITIVE_POLYNOMIALS_CPP_SOURCE = SCRIPT_DIR / "primitivepolynomials.cpp"
+# Binary copy of the tables in the C++ sources, written by build_joekuo_table.py
+JOE_KUO_D5_ASSET = SCRIPT_DIR / "data" / "joekuo_d5.bin"
+
+BITS = 32
+NORMALIZATION_FACTOR = 0.5 / (1 << 31)
+
+# Supported draw() output types -> (right shift, scale) applied to the 32-bit
+# integers. float32 keeps only the top 24 bits, which it represents exactly, so
+# that rounding never maps a point to 1.0
+FLOAT_CONVERSIONS = {
+    np.dtype(np.float64): (0, NORMALIZATION_FACTOR),
+    np.dtype(np.float32): (8, 0.5 / (1 << 23)),
+}
+
+# Number of consecutive points generated by each thread of the Numba kernels
+POINT_TILE = 1024
+
+# Number of integers drawn before each float conversion in the NumPy kernel,
+# also the size of the blocks of its prefix-XOR recurrence
+SCALED_DRAW_BUFFER_SIZE = 1 << 16
+
+# From this many dimensions the NumPy kernel XORs one row per point, which
+# beats gathering and prefix-XOR-ing blocks of rows
+ROW_LOOP_MIN_DIMENSIONALITY = 448
+
+# Bits of a point index resolved by one lookup in the segment tables
+SEGMENT_BITS = 8
+
+# Number of integers looked up at a time in the segment tables
+SEGMENT_LOOKUP_BLOCK_SIZE = 1 << 16
+
+# Default name of the shared memory block set up by share_direction_integers()
+SHARED_DIRECTIONS_NAME = "quasarquant_sobol_joe_kuo_d5"
+
+# Largest counter value before the 32-bit sequence wraps around
+MAX_SEQUENCE_COUNTER = 0xFFFFFFFE
+
+# const std::uint32_t dim1JoeKuoD5Init[] = { 1 ,0 };
+_JOE_KUO_D5_PATTERN = re.compile(r"dim(\d+)JoeKuoD5Init\[\]\s*=\s*\{([^}]*)\}")
+# static const long PrimitivePolynomialDegree01[]={ 0, /* x+1 (1)(1) */ -1 };
+_PRIMITIVE_POLYNOMIAL_PATTERN = re.compile(r"PrimitivePolynomialDegree(\d\d)\[\]\s*=\s*\{([^}]*)\}")
+# Module attribute names of the C++ arrays, see __getattr__()
+_JOE_KUO_D5_INIT_NAME = re.compile(r"dim(\d+)JoeKuoD5Init")
+
+
+def _parse_values(values_block):
+    """Turns the body of a C++ array initializer into an int64 array."""
+    values_no_comments = re.sub(r"/\*.*?\*/", "", values_block, flags=re.DOTALL)
+    return np.fromstring(values_no_comments, dtype=np.int64, sep=",")
+
+
+def _build_direction_integers(init, degree, poly, dimensionality):
+    directions = np.zeros((dimensionality, BITS), dtype=np.uint32)
+    # degenerate (no free direction integers) first dimension
+    directions[0] = np.uint32(1) << np.arange(BITS - 1, -1, -1, dtype=np.uint32)
+    # free direction integers of all the other dimensions in one go: the zero
+    # padding of the table stays zero
+    width = init.shape[1]
+    directions[1:, :width] = init[:dimensionality - 1].astype(np.uint32) << np.arange(
+        BITS - 1, BITS - width - 1, -1, dtype=np.uint32)
+    if dimensionality == 1:
+        return directions
+
+    # eq. 8.19 "Monte Carlo Methods in Finance" by P. Jäckel, for all dimensions
+    # at once: v[l] = v[l - g] ^ (v[l - g] >> g) ^ sum over j of a_j v[l - j],
+    # with the polynomial coefficients a_j turned into all-ones/all-zeros masks
+    # instead of branches. Masks of j >= g are zero, so every row runs the same
+    # fixed number of terms whatever its degree
+    v = directions[1:]
+    rows = np.arange(dimensionality - 1)
+    g = degree[:dimensionality - 1].astype(np.intp)
+    ppmt = poly[:dimensionality - 1].astype(np.uint32)
+    terms = np.arange(width)
+    # a_j is bit g - j - 1 of ppmt, for 1 <= j < g
+    shift = g[:, None] - terms - 1
+    coefficients = np.where((terms >= 1) & (shift >= 0),
+                            (ppmt[:, None] >> np.maximum(shift, 0).astype(np.uint32)) & 1, 0)
+    masks = (-coefficients.astype(np.int64)).astype(np.uint32)
+    g_shift = g.astype(np.uint32)
+    for l in range(1, BITS):
+        # only rows past their free direction integers are extended
+        active = l >= g
+        previous = v[rows, np.maximum(l - g, 0)]
+        n = previous ^ (previous >> g_shift)
+        for j in range(1, min(l + 1, width)):
+            n ^= v[:, l - j] & masks[:, j]
+        v[:, l] = np.where(active, n, v[:, l])
+    return directions
+
+
+def parse_joe_kuo_d5_sources():
+    """
+    Parses the JoeKuoD5 tables out of sobolrsg.cpp and primitivepolynomials.cpp.
+
+    Returns a dict with the arrays stored in JOE_KUO_D5_ASSET:
+    init, the zero padded (MAX_DIMENSIONALITY - 1, max degree) uint16 matrix of
+    free direction integers (the values before the 0 that terminates each C++
+    array); degree, the uint8 row lengths, which are also the degrees of the
+    primitive polynomials; poly, the uint16 primitive polynomials (ppmt) in the
+    order SobolRsg assigns them to dimensions 1, 2, ...; directions, the
+    (MAX_DIMENSIONALITY, BITS) uint32 direction integers they lead to, so that
+    SobolRsg only has to slice them.
+    """
+    cpp_code = SOBOL_CPP_SOURCE.read_text(encoding="latin-1")
+    matches = _JOE_KUO_D5_PATTERN.findall(cpp_code)
+    dimensions = np.array([int(dimension) for dimension, _ in matches])
+    # all the initializers in one C-level parse; each C++ array ends with a 0,
+    # which never occurs as a direction integer (they are odd)
+    values = np.fromstring(",".join(block for _, block in matches), dtype=np.int64, sep=",")
+    ends = np.flatnonzero(values == 0)
+    if len(ends) != len(matches):
+        raise ValueError("every JoeKuoD5 initializer must end with a single 0")
+    lengths = np.diff(ends, prepend=-1) - 1
+
+    cpp_code = PRIMITIVE_POLYNOMIALS_CPP_SOURCE.read_text(encoding="latin-1")
+    degree, ppmt = [], []
+    for match in _PRIMITIVE_POLYNOMIAL_PATTERN.finditer(cpp_code):
+        polynomials = _parse_values(match.group(2))
+        # -1 marks the end of the polynomials of a given degree
+        polynomials = polynomials[:np.flatnonzero(polynomials == -1)[0]]
+        degree.append(np.full(len(polynomials), int(match.group(1))))
+        ppmt.append(polynomials)
+    degree, ppmt = np.concatenate(degree), np.concatenate(ppmt)
+
+    # scatter the values row by row into the zero padded matrix, then put the
+    # rows in dimension order
+    init = np.zeros((len(matches), lengths.max()), dtype=np.uint16)
+    init[np.arange(init.shape[1]) < lengths[:, None]] = values[values != 0]
+    order = np.argsort(dimensions, kind="stable")
+    init, lengths = init[order], lengths[order]
+    if not np.array_equal(lengths, degree[:len(matches)]):
+        raise ValueError("JoeKuoD5 initializers do not match the primitive polynomial degrees")
+    degree = lengths.astype(np.uint8)
+    poly = ppmt[:len(matches)].astype(np.uint16)
+    return {
+        "init": init,
+        "degree": degree,
+        "poly": poly,
+        "directions": _build_direction_integers(init, degree, poly, len(matches) + 1),
+    }
+
+
+# Layout of JOE_KUO_D5_ASSET: a header of four little-endian uint32 (magic,
+# format version, number of tabulated rows n, initializer width w) followed by
+# the sections below, in order of decreasing item size so that every section
+# is aligned. directions is stored bit-major, (BITS, n + 1)
+_ASSET_MAGIC = 0x3544_4B4A  # "JKD5"
+_ASSET_VERSION = 1
+_ASSET_HEADER = np.dtype("<u4")
+
+
+def _asset_sections(n, width):
+    return [
+        ("directions", np.dtype("<u4"), (BITS, n + 1)),
+        ("init", np.dtype("<u2"), (n, width)),
+        ("poly", np.dtype("<u2"), (n,)),
+        ("degree", np.dtype("u1"), (n,)),
+    ]
+
+
+def pack_joe_kuo_d5_asset(tables):
+    """Serialises the tables returned by parse_joe_kuo_d5_sources() into the asset layout."""
+    n, width = tables["init"].shape
+    header = np.array([_ASSET_MAGIC, _ASSET_VERSION, n, width], dtype=_ASSET_HEADER)
+    sections = {"directions": tables["directions"].T}
+    return header.tobytes() + b"".join(
+        np.ascontiguousarray(sections.get(name, tables[name]), dtype=dtype).tobytes()
+        for name, dtype, _ in _asset_sections(n, width))
+
+
+def unpack_joe_kuo_d5_asset(buffer):
+    """
+    Returns read-only views of the tables in an asset buffer, with the same
+    keys and shapes as parse_joe_kuo_d5_sources(); nothing is copied.
+    """
+    magic, version, n, width = np.frombuffer(buffer, dtype=_ASSET_HEADER, count=4).tolist()
+    if magic != _ASSET_MAGIC or version != _ASSET_VERSION:
+        raise ValueError("not a JoeKuoD5 asset of a supported version, rebuild it with build_joekuo_table.py")
+    arrays = {}
+    offset = 4 * _ASSET_HEADER.itemsize
+    for name, dtype, shape in _asset_sections(n, width):
+        count = int(np.prod(shape))
+        arrays[name] = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).reshape(shape)
+        offset += count * dtype.itemsize
+    arrays["directions"] = arrays["directions"].T
+    return arrays
+
+
+@functools.lru_cache(maxsize=None)
+def _joe_kuo_d5_arrays():
+    """
+    Maps the JoeKuoD5 tables from JOE_KUO_D5_ASSET, falling back to parsing
+    the C++ sources if the asset has not been built.
+
+    The asset is memory-mapped: the OS only pages in the rows that are
+    touched, and every process reading it shares the same page cache.
+    """
+    if JOE_KUO_D5_ASSET.exists():
+        arrays = unpack_joe_kuo_d5_asset(np.memmap(JOE_KUO_D5_ASSET, dtype=np.uint8, mode="r"))
+    else:
+        arrays = parse_joe_kuo_d5_sources()
+    for array in arrays.values():
+        array.flags.writeable = False
+    return arrays
+
+
+def direction_numbers(dimension):
+    """
+    Returns a read-only view of the free direction integers (Joe-Kuo m_i
+    values) of dimension (0-based, 1 <= dimension < MAX_DIMENSIONALITY).
+    """
+    if not 1 <= dimension < MAX_DIMENSIONALITY:
+        raise ValueError(f"dimension {dimension} has no tabulated direction numbers")
+    init, degree = joe_kuo_d5_table()
+    return init[dimension - 1, :degree[dimension - 1]]
+
+
+def joe_kuo_d5_table():
+    """
+    Returns the JoeKuoD5 initializers as a dense, zero padded, read-only
+    (MAX_DIMENSIONALITY - 1, max degree) uint16 array together with the uint8
+    vector of row lengths, which equal the degrees of the primitive polynomials.
+
+    The initializers are odd and smaller than 2^16, so uint16 holds them in
+    half the space; widen them before shifting.
+    """
+    arrays = _joe_kuo_d5_arrays()
+    return arrays["init"], arrays["degree"]
+
+
+@functools.lru_cache(maxsize=None)
+def joe_kuo_d5_initializers():
+    """
+    Returns the JoeKuoD5 initializers as a tuple of tuples: entry k-1 holds the
+    free direction integers of dimension k (0-based).
+    """
+    table, lengths = joe_kuo_d5_table()
+    return tuple(tuple(row[:length].tolist()) for row, length in zip(table, lengths))
+
+
+@functools.lru_cache(maxsize=None)
+def primitive_polynomials():
+    """
+    Returns (degree, ppmt) for the primitive polynomials of the tabulated
+    dimensions, in the order SobolRsg assigns them to dimensions 1, 2, ...
+    """
+    arrays = _joe_kuo_d5_arrays()
+    return tuple(arrays["degree"].tolist()), tuple(arrays["poly"].tolist())
+
+
+MAX_DIMENSIONALITY = len(joe_kuo_d5_table()[0]) + 1
+
+
+def _joe_kuo_d5_init_array(dimension):
+    row = array.array("I", direction_numbers(dimension).astype(np.uint32).tobytes())
+    row.append(0)
+    return row
+
+
+def __getattr__(name):
+    """
+    Resolves the C++ array names dim1JoeKuoD5Init ... dim1999JoeKuoD5Init,
+    each read from the mapped table as an array.array("I") of its C++
+    initializer, 0 terminator included. Like the C++ arrays it holds packed
+    32-bit integers, exposed through the buffer protocol. Every access builds
+    a new array, so changing one does not change the table.
+    """
+    match = _JOE_KUO_D5_INIT_NAME.fullmatch(name)
+    if match and 1 <= int(match.group(1)) < MAX_DIMENSIONALITY:
+        return _joe_kuo_d5_init_array(int(match.group(1)))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def compute_direction_integers(dimensionality):
+    """
+    Returns the (dimensionality, BITS) uint32 matrix of direction integers,
+    built exactly as in the SobolRsg constructor from the loaded tables.
+    """
+    init, degree = joe_kuo_d5_table()
+    return _build_direction_integers(init, degree, _joe_kuo_d5_arrays()["poly"], dimensionality)
+
+
+def direction_integers(dimensionality):
+    """
+    Returns the (dimensionality, BITS) uint32 matrix of direction integers, a
+    copy of the rows precomputed in JOE_KUO_D5_ASSET.
+    """
+    return _joe_kuo_d5_arrays()["directions"][:dimensionality].copy()
+
+
+@functools.lru_cache(maxsize=None)
+def _local_bit_major_directions():
+    directions = np.ascontiguousarray(_joe_kuo_d5_arrays()["directions"].T)
+    directions.flags.writeable = False
+    return directions
+
+
+# (block, directions view, created by this process) once share_direction_integers() is called
+_shared_directions = None
+
+# Marks a fully written block, stored in the first 8 bytes
+_SHARED_BLOCK_READY = 0x5155415341525121
+
+
+def bit_major_directions():
+    """
+    Returns the read-only (BITS, MAX_DIMENSIONALITY) uint32 direction integers
+    used by every generator of the process: generators slice their leading
+    columns rather than copying them.
+    """
+    if _shared_directions is not None:
+        return _shared_directions[1]
+    return _local_bit_major_directions()
+
+
+class _SharedBlockBuffer:
+    """
+    Exposes the bytes of a SharedMemory block through __array_interface__ and
+    owns the block: arrays viewing it keep this object, hence the mapping,
+    alive, and the block is closed once the last of them is gone.
+    """
+
+    def __init__(self, block, size):
+        self._block = block
+        # the address is read off a temporary view, released right away, so
+        # that no buffer export of block.buf keeps the block from closing
+        address = np.frombuffer(block.buf, dtype=np.uint8, count=size).ctypes.data
+        self.__array_interface__ = {"shape": (size,), "typestr": "|u1", "data": (address, False), "version": 3}
+
+
+def _attach_shared_block(name):
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    block = shared_memory.SharedMemory(name=name)
+    # only the process that created the block may unlink it when it exits
+    resource_tracker.unregister(block._name, "shared_memory")
+    return block
+
+
+def share_direction_integers(name=SHARED_DIRECTIONS_NAME, timeout=10.0):
+    """
+    Backs bit_major_directions() with the multiprocessing.shared_memory block
+    name, creating and filling it unless another process already has, so that
+    all the processes of e.g. a worker pool map one physical copy of the
+    table. Call it before creating generators, typically in the parent and in
+    the pool initializer. The block is unlinked when the process that created
+    it exits or calls release_shared_direction_integers().
+    """
+    global _shared_directions
+    if _shared_directions is not None:
+        return
+    local = _local_bit_major_directions()
+    header = np.dtype(np.uint64).itemsize
+    try:
+        block = shared_memory.SharedMemory(name=name, create=True, size=header + local.nbytes)
+        created = True
+    except FileExistsError:
+        block = _attach_shared_block(name)
+        created = False
+
+    # every view below holds the block through raw, see _SharedBlockBuffer
+    raw = np.asarray(_SharedBlockBuffer(block, header + local.nbytes))
+    ready = raw[:header].view(np.uint64)
+    directions = raw[header:].view(np.uint32).reshape(local.shape)
+    if created:
+        directions[:] = local
+        ready[0] = _SHARED_BLOCK_READY
+    else:
+        deadline = time.monotonic() + timeout
+        while ready[0] != _SHARED_BLOCK_READY:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"shared memory block {name} was never filled")
+            time.sleep(0.001)
+    directions.flags.writeable = False
+    _shared_directions = (block, directions, created)
+    if created:
+        atexit.register(release_shared_direction_integers)
+
+
+def release_shared_direction_integers():
+    """
+    Goes back to a private table; the shared block is unlinked if this process
+    created it. The mapping itself is closed only when the arrays viewing it,
+    such as the direction tables of generators created in the meantime, are
+    gone.
+    """
+    global _shared_directions
+    if _shared_directions is None:
+        return
+    block, _, created = _shared_directions
+    _shared_directions = None
+    if created:
+        atexit.unregister(release_shared_direction_integers)
+        block.unlink()
+
+
+def trailing_zeros_range(first, n):
+    """
+    Trailing zero bits of the n consecutive integers first, first + 1, ...
+    (first > 0) as uint8, built as a ruler sequence: one strided increment per
+    power of two dividing some of them.
+    """
+    out = np.zeros(n, dtype=np.uint8)
+    for j in range(1, 64):
+        step = 1 << j
+        # first multiple of 2^j in the range
+        begin = -first % step
+        if begin >= n:
+            break
+        out[begin::step] += 1
+    return out
+
+
+def float_conversion(dtype):
+    """Returns the (shift, factor) of FLOAT_CONVERSIONS for dtype, which must be one of its keys."""
+    dtype = np.dtype(dtype)
+    if dtype not in FLOAT_CONVERSIONS:
+        raise ValueError(f"unsupported dtype {dtype}, use one of "
+                         f"{', '.join(str(t) for t in FLOAT_CONVERSIONS)}")
+    return FLOAT_CONVERSIONS[dtype]
+
+
+def output_array(shape, dtype, out=None):
+    """Returns out after checking its shape and dtype, or a new array if out is None."""
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if out.shape != shape or out.dtype != dtype:
+        raise ValueError(f"out must be a {shape} {np.dtype(dtype)} array, got a {out.shape} {out.dtype} one")
+    if not out.flags.writeable:
+        raise ValueError("out must be writeable")
+    return out
+
+
+def segment_tables(directions):
+    """
+    Returns, for each SEGMENT_BITS-bit segment of a point index, the
+    (2^SEGMENT_BITS, width) uint32 table of the XOR of the bit-major direction
+    rows selected by every value of that segment, so that the point with a
+    given index takes BITS / SEGMENT_BITS lookups instead of up to BITS XORs.
+    """
+    values = 1 << SEGMENT_BITS
+    tables = np.zeros((BITS // SEGMENT_BITS, values, directions.shape[1]), dtype=np.uint32)
+    for k in range(len(tables)):
+        for value in range(1, values):
+            # value with its lowest set bit cleared, plus that bit's direction
+            lowest = (value & -value).bit_length() - 1
+            np.bitwise_xor(tables[k, value & (value - 1)], directions[SEGMENT_BITS * k + lowest],
+                           out=tables[k, value])
+    return tables
+
+
+def segment_table_lookup(tables, indices, out):
+    """Sets out[i] to the XOR of the direction rows selected by the bits of indices[i]."""
+    mask = np.uint32((1 << SEGMENT_BITS) - 1)
+    out[:] = tables[0][indices & mask]
+    for k in range(1, len(tables)):
+        out ^= tables[k][(indices >> np.uint32(SEGMENT_BITS * k)) & mask]
+
+
+# Coefficients of the rational approximations of InverseCumulativeNormal
+# (Acklam's algorithm, see normaldistribution.cpp), central region a / b,
+# tails c / d, and the limits of the central region
+_ICN_A = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+          1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+_ICN_B = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+          6.680131188771972e+01, -1.328068155288572e+01)
+_ICN_C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+          -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+_ICN_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+          3.754408661907416e+00)
+_ICN_X_LOW = 0.02425
+_ICN_X_HIGH = 1.0 - _ICN_X_LOW
+
+
+def inverse_cumulative_normal(x):
+    """
+    Vectorised InverseCumulativeNormal::standard_value() for 0 < x < 1,
+    returned as float64 (relative error below 1.15e-9, no Halley refinement).
+    """
+    x = np.asarray(x, dtype=np.float64)
+    a, b, c, d = _ICN_A, _ICN_B, _ICN_C, _ICN_D
+    # central region everywhere, then overwrite the few tail values
+    z = x - 0.5
+    r = z * z
+    z = ((((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * z /
+         (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1.0))
+    tails = np.flatnonzero((x < _ICN_X_LOW) | (_ICN_X_HIGH < x))
+    if tails.size:
+        p = x.flat[tails]
+        q = np.sqrt(-2.0 * np.log(np.where(p < _ICN_X_LOW, p, 1.0 - p)))
+        tail = ((((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) /
+                ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1.0))
+        z.flat[tails] = np.where(p < _ICN_X_LOW, tail, -tail)
+    return z
+
+
+# The batch kernels take the whole C-contiguous bit-major direction table and
+# use its first integer_sequence.shape[0] columns
+
+def _gray_code_draw_numpy(integer_sequence, directions, bits, out):
+    dimensionality = out.shape[1]
+    if dimensionality >= ROW_LOOP_MIN_DIMENSIONALITY:
+        # state and directions are padded to an even width: XOR them as uint64
+        # so that each operation advances two dimensions
+        state = integer_sequence.view(np.uint64)
+        wide_directions = directions[:, :integer_sequence.shape[0]].view(np.uint64)
+        for i, j in enumerate(bits):
+            np.bitwise_xor(state, wide_directions[j], out=state)
+            out[i] = integer_sequence[:dimensionality]
+        return
+    # point i is the state XOR the prefix XOR of the direction rows of steps
+    # 0..i: gather the rows of a block of steps and let one accumulate call do
+    # the whole recurrence
+    block = max(1, SCALED_DRAW_BUFFER_SIZE // dimensionality)
+    table = directions[:, :dimensionality]
+    state = integer_sequence[:dimensionality]
+    for begin in range(0, len(bits), block):
+        rows = out[begin:begin + block]
+        np.take(table, bits[begin:begin + block], axis=0, out=rows)
+        np.bitwise_xor.accumulate(rows, axis=0, out=rows)
+        rows ^= state
+        state[:] = rows[-1]
+
+
+def _gray_code_draw_scaled_numpy(integer_sequence, directions, bits, shift, factor, out):
+    # a per-row float conversion costs more than it saves in NumPy: draw blocks
+    # of integer rows into a small buffer that stays in cache and convert each
+    # block with one call, instead of materialising the whole integer matrix
+    dimensionality = out.shape[1]
+    block = max(1, SCALED_DRAW_BUFFER_SIZE // dimensionality)
+    buffer = np.empty((min(block, len(bits)), dimensionality), dtype=np.uint32)
+    for begin in range(0, len(bits), block):
+        end = min(begin + block, len(bits))
+        rows = buffer[:end - begin]
+        _gray_code_draw_numpy(integer_sequence, directions, bits[begin:end], rows)
+        np.right_shift(rows, shift, out=rows)
+        np.multiply(rows, factor, out=out[begin:end])
+
+
+def _gray_code_draw_normal_numpy(integer_sequence, directions, bits, out):
+    # blocks as in _gray_code_draw_scaled_numpy: the uniforms of a block are
+    # still in cache when they go through the inverse cumulative normal
+    dimensionality = out.shape[1]
+    block = max(1, SCALED_DRAW_BUFFER_SIZE // dimensionality)
+    buffer = np.empty((min(block, len(bits)), dimensionality), dtype=np.float64)
+    for begin in range(0, len(bits), block):
+        end = min(begin + block, len(bits))
+        rows = buffer[:end - begin]
+        _gray_code_draw_scaled_numpy(integer_sequence, directions, bits[begin:end], 0, NORMALIZATION_FACTOR, rows)
+        out[begin:end] = inverse_cumulative_normal(rows)
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _tile_start_states(integer_sequence, directions, bits):
+        """
+        Returns the state before the first point of every POINT_TILE tile and
+        leaves integer_sequence at the state after the last point.
+        """
+        tiles = (bits.shape[0] + POINT_TILE - 1) // POINT_TILE
+        starts = np.empty((tiles, integer_sequence.shape[0]), dtype=np.uint32)
+        parity = np.empty(BITS, dtype=np.uint8)
+        for tile in range(tiles):
+            starts[tile] = integer_sequence
+            # XOR is commutative: only the directions flipped an odd number of
+            # times within the tile change the state
+            parity[:] = 0
+            for i in range(tile * POINT_TILE, min((tile + 1) * POINT_TILE, bits.shape[0])):
+                parity[bits[i]] ^= 1
+            for j in range(BITS):
+                if parity[j]:
+                    integer_sequence ^= directions[j, :integer_sequence.shape[0]]
+        return starts
+
+    @numba.njit(parallel=True, cache=True)
+    def _gray_code_draw_numba(integer_sequence, directions, bits, out):
+        # each thread walks a tile of points over full rows, so that out is
+        # written contiguously and the direction rows stay in cache
+        dimensionality = out.shape[1]
+        starts = _tile_start_states(integer_sequence, directions, bits)
+        for tile in numba.prange(starts.shape[0]):
+            x = starts[tile, :dimensionality].copy()
+            for i in range(tile * POINT_TILE, min((tile + 1) * POINT_TILE, bits.shape[0])):
+                direction = directions[bits[i]]
+                row = out[i]
+                # unit stride on both operands lets LLVM vectorise the XOR
+                for k in range(dimensionality):
+                    x[k] ^= direction[k]
+                    row[k] = x[k]
+
+    @numba.njit(parallel=True, cache=True)
+    def _gray_code_draw_scaled_numba(integer_sequence, directions, bits, shift, factor, out):
+        # same walk as _gray_code_draw_numba, but the XOR result is scaled and
+        # stored as a float in the same pass
+        dimensionality = out.shape[1]
+        starts = _tile_start_states(integer_sequence, directions, bits)
+        for tile in numba.prange(starts.shape[0]):
+            x = starts[tile, :dimensionality].copy()
+            for i in range(tile * POINT_TILE, min((tile + 1) * POINT_TILE, bits.shape[0])):
+                direction = directions[bits[i]]
+                row = out[i]
+                for k in range(dimensionality):
+                    x[k] ^= direction[k]
+                    row[k] = (x[k] >> shift) * factor
+
+    @numba.njit(cache=True)
+    def _inverse_cumulative_normal_scalar(x):
+        a, b, c, d = _ICN_A, _ICN_B, _ICN_C, _ICN_D
+        if x < _ICN_X_LOW or _ICN_X_HIGH < x:
+            q = np.sqrt(-2.0 * np.log(x if x < _ICN_X_LOW else 1.0 - x))
+            z = ((((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) /
+                 ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1.0))
+            return z if x < _ICN_X_LOW else -z
+        z = x - 0.5
+        r = z * z
+        return ((((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * z /
+                (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1.0))
+
+    @numba.njit(parallel=True, cache=True)
+    def _gray_code_draw_normal_numba(integer_sequence, directions, bits, out):
+        # same walk as _gray_code_draw_numba, each integer goes through the
+        # uniform and the inverse cumulative normal in registers and only the
+        # normal deviate is stored
+        dimensionality = out.shape[1]
+        starts = _tile_start_states(integer_sequence, directions, bits)
+        for tile in numba.prange(starts.shape[0]):
+            x = starts[tile, :dimensionality].copy()
+            for i in range(tile * POINT_TILE, min((tile + 1) * POINT_TILE, bits.shape[0])):
+                direction = directions[bits[i]]
+                row = out[i]
+                for k in range(dimensionality):
+                    x[k] ^= direction[k]
+                    row[k] = _inverse_cumulative_normal_scalar(x[k] * NORMALIZATION_FACTOR)
+
+    _gray_code_draw = _gray_code_draw_numba
+    _gray_code_draw_scaled = _gray_code_draw_scaled_numba
+    _gray_code_draw_normal = _gray_code_draw_normal_numba
+else:
+    _gray_code_draw = _gray_code_draw_numpy
+    _gray_code_draw_scaled = _gray_code_draw_scaled_numpy
+    _gray_code_draw_normal = _gray_code_draw_normal_numpy
+
+
+# One thread per (point, dimension): x covers dimensions, so that a warp
+# writes consecutive floats of a row, y covers points
+CUDA_BLOCK = (32, 8)
+
+_CUDA_DRAW_SOURCE = r"""
+extern "C" __global__
+void sobol_draw_float32(const unsigned int* directions, int width, int dimensionality,
+                        unsigned long long first, int repeat, int gray, int n,
+                        int shift, float factor, float* out)
+{
+    int d = blockIdx.x * blockDim.x + threadIdx.x;
+    if (d >= dimensionality)
+        return;
+    for (int i = blockIdx.y * blockDim.y + threadIdx.y; i < n; i += gridDim.y * blockDim.y) {
+        // point i has the sequence counter first + i, less the repeated first point
+        unsigned int index = (unsigned int)(first + max(i - repeat, 0)) + 1u;
+        unsigned int bits = gray ? index ^ (index >> 1) : index;
+        unsigned int x = 0;
+        while (bits) {
+            x ^= directions[(__ffs(bits) - 1) * width + d];
+            bits &= bits - 1;
+        }
+        out[(long long)i * dimensionality + d] = (x >> shift) * factor;
+    }
+}
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _cuda_draw_kernel():
+    return cupy.RawKernel(_CUDA_DRAW_SOURCE, "sobol_draw_float32")
+
+
+@functools.lru_cache(maxsize=None)
+def _device_directions():
+    """The bit-major direction table, uploaded to the current device once."""
+    return cupy.asarray(bit_major_directions())
+
+
+class SobolRsg:
+    """
+    Sobol low-discrepancy sequence generator (Joe-Kuo D5 direction integers).
+
+    The first draw returns the point with index 1 (the origin is skipped), as
+    the C++ implementation does.
+    """
+
+    def __init__(self, dimensionality, use_gray_code=True):
+        if dimensionality <= 0:
+            raise ValueError("dimensionality must be greater than 0")
+        if dimensionality > MAX_DIMENSIONALITY:
+            raise ValueError(f"dimensionality {dimensionality} exceeds the number of "
+                             f"tabulated Joe-Kuo D5 dimensions ({MAX_DIMENSIONALITY})")
+
+        self._dimensionality = dimensionality
+        self._use_gray_code = use_gray_code
+        # bit-major, (BITS, width): row j holds direction integer j of every
+        # dimension, so each Gray-code step XORs one contiguous row. The width is
+        # rounded up to even, which lets the rows and the state be viewed as
+        # uint64 pairs; the extra column is never returned
+        width = dimensionality + dimensionality % 2
+        # the process-wide table, nothing is copied
+        table = bit_major_directions()
+        if width > table.shape[1]:
+            table = np.zeros((BITS, width), dtype=np.uint32)
+            table[:, :dimensionality] = bit_major_directions()
+        # the batch kernels get the whole table rather than a column slice: rows
+        # of a C-contiguous array have a unit stride known at compile time,
+        # which Numba needs to vectorise the XOR
+        self._direction_table = table
+        self._directions = table[:, :width]
+        self._sequence_counter = 0
+        self._first_draw = True
+        self._integer_sequence = np.zeros(width, dtype=np.uint32)
+        self._sequence = np.zeros(dimensionality, dtype=np.float64)
+        self._segment_tables = None
+
+        # first draw, this is only needed if Gray code is used
+        if use_gray_code:
+            self._integer_sequence[:] = self._directions[0]
+
+    def dimension(self):
+        return self._dimensionality
+
+    def skip_to(self, skip):
+        """Skips to the skip-th sample in the low-discrepancy sequence."""
+        skip = int(skip)
+        # the C++ std::uint32_t argument would wrap around instead
+        if not 0 <= skip <= MAX_SEQUENCE_COUNTER:
+            raise ValueError(f"skip {skip} is outside the 32-bit sequence [0, {MAX_SEQUENCE_COUNTER}]")
+        n = skip + 1
+        if self._use_gray_code:
+            # Convert to Gray code
+            n ^= n >> 1
+        # XOR of the direction rows selected by the set bits, in one reduction
+        rows = [index for index in range(n.bit_length()) if (n >> index) & 1]
+        np.bitwise_xor.reduce(self._directions[rows], axis=0, out=self._integer_sequence)
+        self._sequence_counter = skip
+        return self._current_int32_sequence()
+
+    def next_int32_sequence(self):
+        if not self._use_gray_code:
+            self.skip_to(self._sequence_counter)
+            if self._first_draw:
+                self._first_draw = False
+            else:
+                self._advance_counter(1)
+            return self._current_int32_sequence()
+
+        if self._first_draw:
+            # it was precomputed in the constructor
+            self._first_draw = False
+            return self._current_int32_sequence()
+
+        self._advance_counter(1)
+        # Find rightmost zero bit of the counter: n + 1 clears the trailing ones
+        # and sets that bit, ~n keeps only it
+        n = self._sequence_counter
+        j = ((n + 1) & ~n).bit_length() - 1
+        self._integer_sequence ^= self._directions[j]
+        return self._current_int32_sequence()
+
+    def next_sequence(self):
+        self._sequence = self.next_int32_sequence() * NORMALIZATION_FACTOR
+        return self._sequence.copy()
+
+    def last_sequence(self):
+        return self._sequence.copy()
+
+    def draw_int32(self, n, out=None):
+        """
+        Returns the next n integer points as an (n, dimensionality) uint32 array,
+        the same values n calls to next_int32_sequence() would produce.
+
+        The points are written into out if given, which saves the allocation
+        when a simulation draws batch after batch of the same size.
+        """
+        out = output_array((n, self._dimensionality), np.uint32, out)
+        if n == 0:
+            return out
+        if not self._use_gray_code:
+            # points are independent of each other, look them up by index
+            first, repeat = self._advance_batch(n)
+            indices = first + 1 + np.maximum(np.arange(n, dtype=np.int64) - repeat, 0)
+            if self._segment_tables is None:
+                self._segment_tables = segment_tables(self._directions[:, :self._dimensionality])
+            block = max(1, SEGMENT_LOOKUP_BLOCK_SIZE // self._dimensionality)
+            for begin in range(0, n, block):
+                segment_table_lookup(self._segment_tables, indices[begin:begin + block].astype(np.uint32),
+                                     out[begin:begin + block])
+            return out
+
+        start, bits = self._gray_code_steps(n)
+        if start:
+            out[0] = self._integer_sequence[:self._dimensionality]
+        _gray_code_draw(self._integer_sequence, self._direction_table, bits, out[start:])
+        return out
+
+    def draw(self, n, dtype=np.float64, out=None):
+        """
+        Returns the next n points of the sequence as an (n, dimensionality) array.
+
+        dtype can be float64 (default, same values as next_sequence()) or
+        float32, which halves the memory traffic and is accurate enough for
+        most pricing workloads; float32 points carry the top 24 bits of the
+        integer sequence. out, if given, must be an (n, dimensionality) array
+        of that dtype and is filled and returned.
+        """
+        shift, factor = float_conversion(dtype)
+
+        out = output_array((n, self._dimensionality), dtype, out)
+        if n == 0:
+            return out
+        if not self._use_gray_code:
+            np.multiply(self.draw_int32(n) >> shift, factor, out=out)
+        else:
+            start, bits = self._gray_code_steps(n)
+            if start:
+                np.multiply(self._integer_sequence[:self._dimensionality] >> shift, factor, out=out[0])
+            _gray_code_draw_scaled(self._integer_sequence, self._direction_table, bits, shift, factor,
+                                   out[start:])
+        self._sequence = out[-1].astype(np.float64)
+        return out
+
+    def draw_normal(self, n, dtype=np.float64, out=None):
+        """
+        Returns the next n points mapped through the inverse cumulative normal,
+        as InverseCumulativeRsg<SobolRsg, InverseCumulativeNormal> would, in an
+        (n, dimensionality) array of float64 (default) or float32, see draw()
+        for out.
+
+        The uniforms always keep the full 32 bits; with Gray code they are
+        converted in the same pass that draws them and never stored.
+        last_sequence() returns the last uniform point.
+        """
+        # the uniforms keep their 32 bits, only the dtype check is needed
+        float_conversion(dtype)
+        out = output_array((n, self._dimensionality), dtype, out)
+        if n == 0:
+            return out
+        if not self._use_gray_code:
+            out[:] = inverse_cumulative_normal(self.draw(n))
+            return out
+
+        start, bits = self._gray_code_steps(n)
+        if start:
+            out[0] = inverse_cumulative_normal(self._integer_sequence[:self._dimensionality] * NORMALIZATION_FACTOR)
+        _gray_code_draw_normal(self._integer_sequence, self._direction_table, bits, out[start:])
+        self._sequence = self._current_int32_sequence() * NORMALIZATION_FACTOR
+        return out
+
+    def draw_cuda(self, n):
+        """
+        Returns the next n points as an (n, dimensionality) float32 CuPy array,
+        the same values as draw(n, dtype=np.float32) but generated on the device.
+
+        Each CUDA thread builds one coordinate directly from the (Gray-coded)
+        index of its point, so the batch has no serial dependency; the CPU
+        state is then moved to the last point. Falls back to
+        draw(n, dtype=np.float32) when CuPy is not installed.
+        """
+        if cupy is None:
+            return self.draw(n, dtype=np.float32)
+        out = cupy.empty((n, self._dimensionality), dtype=cupy.float32)
+        if n == 0:
+            return out
+
+        first, repeat = self._advance_batch(n)
+        directions = _device_directions()
+        shift, factor = float_conversion(np.float32)
+        grid = (-(-self._dimensionality // CUDA_BLOCK[0]), min(-(-n // CUDA_BLOCK[1]), 65535))
+        _cuda_draw_kernel()(grid, CUDA_BLOCK, (
+            directions, np.int32(directions.shape[1]), np.int32(self._dimensionality),
+            np.uint64(first), np.int32(repeat), np.int32(self._use_gray_code), np.int32(n),
+            np.int32(shift), np.float32(factor), out))
+
+        self._sequence = np.multiply(self._current_int32_sequence() >> shift, factor,
+                                     dtype=np.float32).astype(np.float64)
+        return out
+
+    def _advance_batch(self, n):
+        """
+        Moves the state past the next n > 0 draws without computing them.
+        Returns (first, repeat): draw i is the point with sequence counter
+        first + max(i - repeat, 0), i.e. the point skip_to() returns.
+        """
+        start = 1 if self._first_draw else 0
+        if self._use_gray_code:
+            first, repeat = self._sequence_counter + 1 - start, 0
+            counter = first + n - 1
+        else:
+            # without Gray code the first point is drawn twice and the counter
+            # runs one ahead of the last point, see next_int32_sequence()
+            first, repeat = self._sequence_counter, start
+            counter = first + n - repeat
+        self._advance_counter(counter - self._sequence_counter)
+        self.skip_to(first + max(n - 1 - repeat, 0))
+        self._sequence_counter = counter
+        self._first_draw = False
+        return first, repeat
+
+    def _gray_code_steps(self, n):
+        """
+        Advances the counter by n Gray-code draws. Returns how many leading draws
+        are the current point (1 on the first draw, which was precomputed in the
+        constructor, 0 otherwise) and the direction integer index each of the
+        remaining draws XORs in.
+        """
+        start = 1 if self._first_draw else 0
+        first = self._sequence_counter + 1
+        self._advance_counter(n - start)
+        self._first_draw = False
+        # the bit flipped by the Gray code of counter c is the rightmost zero of
+        # c, i.e. the lowest set bit of c + 1
+        return start, trailing_zeros_range(first + 1, n - start)
+
+    def _current_int32_sequence(self):
+        return self._integer_sequence[:self._dimensionality].copy()
+
+    def _advance_counter(self, steps):
+        if self._sequence_counter + steps > MAX_SEQUENCE_COUNTER:
+            raise RuntimeError("period exceeded")
+        self._sequence_counter += steps
@@ -0,0 +1,134 @@
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Get script directory and make the Python modules next to the Mojo sources importable
+SCRIPT_DIR = Path(__file__).parent.resolve()
+sys.path.insert(0, str(SCRIPT_DIR.parent))
+
+import burley2020sobolrsg
+import sobolrsg
+from burley2020sobolrsg import Burley2020SobolRsg
+
+
+def reference_nested_uniform_scramble(x, seed):
+    """burley2020sobolrsg.cpp nested_uniform_scramble() on Python ints."""
+    x = int(f"{x:032b}"[::-1], 2)
+    x = (x + seed) & 0xFFFFFFFF
+    for multiplier in [0x6c50b47c, 0xb82f1e52, 0xc7afe638, 0x8d22f6e6]:
+        x ^= (x * multiplier) & 0xFFFFFFFF
+    return int(f"{x:032b}"[::-1], 2)
+
+
+def reference_sequences(dimensionality, sequences, scramble_seed=43, first=0):
+    """Burley2020SobolRsg::nextInt32Sequence, one point and one dimension at a time."""
+    group4_seeds = burley2020sobolrsg.mersenne_twister_int32(scramble_seed, (dimensionality - 1) // 4 + 1)
+    sobol = sobolrsg.SobolRsg(dimensionality, use_gray_code=False)
+    result = []
+    for counter in range(first, first + sequences):
+        n = reference_nested_uniform_scramble(counter, group4_seeds[0])
+        point = [int(v) for v in sobol.skip_to(n)]
+        i, group = 0, 0
+        while i < dimensionality:
+            seed = group4_seeds[group]
+            group += 1
+            for g in range(4):
+                if i == dimensionality:
+                    break
+                seed = burley2020sobolrsg._local_hash_combine(seed, g)
+                point[i] = reference_nested_uniform_scramble(point[i], seed & 0xFFFFFFFF)
+                i += 1
+        result.append(point)
+    return np.array(result, dtype=np.uint32)
+
+
+def test_mersenne_twister_int32():
+    # reference MT19937 output for the default init_genrand seed
+    assert burley2020sobolrsg.mersenne_twister_int32(5489, 2) == [3499211612, 581869302]
+
+
+def test_reverse_bits():
+    values = np.array([0, 1, 0x80000000, 0x12345678, 0xFFFFFFFF, 0xF0], dtype=np.uint32)
+    expected = [int(f"{int(v):032b}"[::-1], 2) for v in values]
+    assert list(burley2020sobolrsg.reverse_bits(values)) == expected
+
+
+@pytest.mark.parametrize("dimensionality", [1, 4, 5, 13])
+def test_next_int32_sequence(dimensionality):
+    rsg = Burley2020SobolRsg(dimensionality)
+    draws = np.array([rsg.next_int32_sequence() for _ in range(40)])
+    assert np.array_equal(draws, reference_sequences(dimensionality, 40))
+
+
+def test_draw_matches_next_sequence(monkeypatch):
+    # a small block size exercises the blocking of the scrambling pass
+    monkeypatch.setattr(burley2020sobolrsg, "SCRAMBLE_BLOCK_SIZE", 64)
+    one_at_a_time = Burley2020SobolRsg(9)
+    expected = np.array([one_at_a_time.next_sequence() for _ in range(100)])
+
+    batched = Burley2020SobolRsg(9)
+    points = np.vstack([batched.draw(30), batched.draw(70)])
+    assert np.array_equal(points, expected)
+    assert np.array_equal(batched.last_sequence(), expected[-1])
+    assert np.all((points >= 0.0) & (points < 1.0))
+
+
+def test_draw_into_preallocated_array():
+    expected = Burley2020SobolRsg(5).draw(60)
+    rsg = Burley2020SobolRsg(5)
+    out = np.empty((30, 5))
+    assert np.array_equal(rsg.draw(30, out=out), expected[:30])
+    assert np.array_equal(rsg.draw(30, out=out), expected[30:])
+    with pytest.raises(ValueError):
+        rsg.draw(30, dtype=np.float32, out=out)
+
+
+def test_draw_into_mismatching_array_keeps_state():
+    expected = Burley2020SobolRsg(3).draw_int32(5)
+    rsg = Burley2020SobolRsg(3)
+    with pytest.raises(ValueError):
+        rsg.draw_int32(5, out=np.empty((4, 3), dtype=np.uint32))
+    with pytest.raises(ValueError):
+        rsg.draw(5, out=np.empty((5, 3), dtype=np.float32))
+    assert np.array_equal(rsg.draw_int32(5), expected)
+
+
+def test_generator_outlives_release_of_shared_direction_integers():
+    expected = Burley2020SobolRsg(5).draw(20)
+    sobolrsg.share_direction_integers(f"quasarquant_test_burley_release_{os.getpid()}")
+    rsg = Burley2020SobolRsg(5)
+    sobolrsg.release_shared_direction_integers()
+    assert np.array_equal(rsg.draw(20), expected)
+
+
+def test_skip_to():
+    draws = Burley2020SobolRsg(6).draw_int32(20)
+    rsg = Burley2020SobolRsg(6)
+    assert np.array_equal(rsg.skip_to(11), draws[11])
+    assert np.array_equal(rsg.next_int32_sequence(), draws[12])
+
+
+def test_skip_to_bounds():
+    rsg = Burley2020SobolRsg(4)
+    last = rsg.skip_to(burley2020sobolrsg.MAX_SEQUENCE_COUNTER - 1)
+    assert np.array_equal(last, reference_sequences(4, 1, first=burley2020sobolrsg.MAX_SEQUENCE_COUNTER - 1)[0])
+    for n in [-1, burley2020sobolrsg.MAX_SEQUENCE_COUNTER, 1 << 32]:
+        with pytest.raises(ValueError):
+            rsg.skip_to(n)
+    # the rejected skips left the generator where it was
+    rsg.skip_to(3)
+    assert np.array_equal(rsg.next_int32_sequence(), Burley2020SobolRsg(4).draw_int32(5)[4])
+
+
+def test_scramble_seed_changes_points():
+    assert not np.array_equal(Burley2020SobolRsg(3).draw(8), Burley2020SobolRsg(3, scramble_seed=44).draw(8))
+
+
+def test_scrambled_integration_error():
+    """Same integrand as testHighDimensionalIntegrals in test-suite/lowdiscrepancysequences.cpp."""
+    points = Burley2020SobolRsg(1000).draw(30031)
+    integral = np.mean(np.prod(1.0 + 0.01 * (points - 0.5), axis=1))
+    assert np.log10(abs(integral - 1.0)) < -4.5
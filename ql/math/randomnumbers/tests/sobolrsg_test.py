@@ -0,0 +1,398 @@
+import gc
+import math
+import os
+import subprocess
+import sys
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Get script directory and make the Python modules next to the Mojo sources importable
+SCRIPT_DIR = Path(__file__).parent.resolve()
+sys.path.insert(0, str(SCRIPT_DIR.parent))
+
+import sobolrsg
+from sobolrsg import SobolRsg
+
+# First dimension of the Sobol sequence (van der Corput sequence modulo two),
+# same values as testSobol in test-suite/lowdiscrepancysequences.cpp
+VAN_DER_CORPUT_SEQUENCE_MODULO_TWO = [
+    # first cycle (zero excluded)
+    0.50000,
+    # second cycle
+    0.75000, 0.25000,
+    # third cycle
+    0.37500, 0.87500, 0.62500, 0.12500,
+    # fourth cycle
+    0.18750, 0.68750, 0.93750, 0.43750, 0.31250, 0.81250, 0.56250, 0.06250,
+    # fifth cycle
+    0.09375, 0.59375, 0.84375, 0.34375, 0.46875, 0.96875, 0.71875, 0.21875,
+    0.15625, 0.65625, 0.90625, 0.40625, 0.28125, 0.78125, 0.53125, 0.03125
+]
+
+TEST_CASES = [
+    {"id": "sobol_1d_31seq", "dimensions": 1, "sequences": 31},
+    {"id": "sobol_2d_100seq", "dimensions": 2, "sequences": 100},
+    {"id": "sobol_33d_64seq", "dimensions": 33, "sequences": 64},
+    {"id": "sobol_100d_257seq", "dimensions": 100, "sequences": 257},
+    {"id": "sobol_max_dim_20seq", "dimensions": sobolrsg.MAX_DIMENSIONALITY, "sequences": 20},
+]
+
+
+@pytest.fixture(params=["numpy", "numba"])
+def gray_code_kernel(request, monkeypatch):
+    """Runs a test with both the NumPy and the (optional) Numba batch kernels."""
+    if request.param == "numba" and sobolrsg.numba is None:
+        pytest.skip("numba not installed")
+    monkeypatch.setattr(sobolrsg, "_gray_code_draw", getattr(sobolrsg, f"_gray_code_draw_{request.param}"))
+    monkeypatch.setattr(sobolrsg, "_gray_code_draw_scaled",
+                        getattr(sobolrsg, f"_gray_code_draw_scaled_{request.param}"))
+    monkeypatch.setattr(sobolrsg, "_gray_code_draw_normal",
+                        getattr(sobolrsg, f"_gray_code_draw_normal_{request.param}"))
+    return request.param
+
+
+def reference_direction_integers(dimensionality):
+    """Straight transliteration of the SobolRsg constructor, one integer at a time."""
+    initializers = sobolrsg.joe_kuo_d5_initializers()
+    degree, ppmt = sobolrsg.primitive_polynomials()
+    directions = [[1 << (32 - j - 1) for j in range(32)]]
+    for k in range(1, dimensionality):
+        v = [0] * 32
+        j = 0
+        # 0 marks coefficients' end for a given dimension
+        row = list(initializers[k - 1]) + [0]
+        while row[j] != 0:
+            v[j] = row[j] << (32 - j - 1)
+            j += 1
+        gk = degree[k - 1]
+        for l in range(gk, 32):
+            n = v[l - gk] >> gk
+            for j in range(1, gk):
+                if (ppmt[k - 1] >> (gk - j - 1)) & 1:
+                    n ^= v[l - j]
+            v[l] = n ^ v[l - gk]
+        directions.append(v)
+    return directions
+
+
+def reference_sequences(dimensionality, sequences):
+    """Gray-code nextInt32Sequence from sobolrsg.cpp, one dimension at a time."""
+    directions = reference_direction_integers(dimensionality)
+    integer_sequence = [directions[k][0] for k in range(dimensionality)]
+    result = [list(integer_sequence)]
+    for counter in range(1, sequences):
+        n, j = counter, 0
+        while n & 1:
+            n >>= 1
+            j += 1
+        for k in range(dimensionality):
+            integer_sequence[k] ^= directions[k][j]
+        result.append(list(integer_sequence))
+    return np.array(result, dtype=np.uint32)
+
+
+def test_van_der_corput_first_dimension():
+    rsg = SobolRsg(1)
+    for i, expected in enumerate(VAN_DER_CORPUT_SEQUENCE_MODULO_TWO):
+        point = rsg.next_sequence()
+        assert abs(point[0] - expected) <= 1.0e-15, f"draw {i + 1}: {point[0]} != {expected}"
+
+
+def test_homogeneity():
+    """The mean of the first 2^j - 1 points is exactly 0.5 in every dimension."""
+    dimensionality = 33
+    rsg = SobolRsg(dimensionality)
+    points = []
+    for j in range(1, 5):
+        while len(points) < 2 ** j - 1:
+            points.append(rsg.next_sequence())
+        mean = np.mean(points, axis=0)
+        assert np.all(np.abs(mean - 0.5) <= 1.0e-15), f"cycle {j + 1}: {mean}"
+
+
+@pytest.mark.parametrize("dimensionality", [1, 2, 5, 40, 250])
+def test_direction_integers(dimensionality):
+    expected = np.array(reference_direction_integers(dimensionality), dtype=np.uint32)
+    assert np.array_equal(sobolrsg.direction_integers(dimensionality), expected)
+    assert np.array_equal(sobolrsg.compute_direction_integers(dimensionality), expected)
+
+
+@pytest.mark.parametrize("test_case", TEST_CASES, ids=[tc["id"] for tc in TEST_CASES])
+def test_next_int32_sequence(test_case):
+    dimensionality, sequences = test_case["dimensions"], test_case["sequences"]
+    rsg = SobolRsg(dimensionality)
+    draws = np.array([rsg.next_int32_sequence() for _ in range(sequences)])
+    assert np.array_equal(draws, reference_sequences(dimensionality, sequences))
+
+
+@pytest.mark.parametrize("test_case", TEST_CASES, ids=[tc["id"] for tc in TEST_CASES])
+def test_draw_matches_next_sequence(test_case, gray_code_kernel):
+    dimensionality, sequences = test_case["dimensions"], test_case["sequences"]
+    one_at_a_time = SobolRsg(dimensionality)
+    expected = np.array([one_at_a_time.next_sequence() for _ in range(sequences)])
+
+    batched = SobolRsg(dimensionality)
+    # split the batch so that the first draw and the continuation are both exercised
+    split = sequences // 3
+    points = np.vstack([batched.draw(split), batched.draw(sequences - split)])
+    assert points.shape == (sequences, dimensionality)
+    assert np.array_equal(points, expected)
+    assert np.array_equal(batched.last_sequence(), expected[-1])
+
+
+def test_joe_kuo_d5_asset_matches_sources():
+    """data/joekuo_d5.bin must be rebuilt with build_joekuo_table.py when the C++ tables change."""
+    assert sobolrsg.JOE_KUO_D5_ASSET.exists()
+    parsed = sobolrsg.parse_joe_kuo_d5_sources()
+    asset = sobolrsg.unpack_joe_kuo_d5_asset(sobolrsg.JOE_KUO_D5_ASSET.read_bytes())
+    assert sorted(asset) == sorted(parsed)
+    for name, array in parsed.items():
+        assert asset[name].dtype == array.dtype
+        assert np.array_equal(asset[name], array)
+
+
+def test_joe_kuo_d5_asset_is_memory_mapped():
+    array = sobolrsg.joe_kuo_d5_table()[0]
+    while not isinstance(array, np.memmap):
+        assert array.base is not None
+        array = array.base
+
+
+def test_direction_numbers():
+    table, _ = sobolrsg.joe_kuo_d5_table()
+    assert np.shares_memory(sobolrsg.direction_numbers(3), table)
+    for dimension in [1, 2, 3, 100, sobolrsg.MAX_DIMENSIONALITY - 1]:
+        assert tuple(sobolrsg.direction_numbers(dimension)) == sobolrsg.joe_kuo_d5_initializers()[dimension - 1]
+    with pytest.raises(ValueError):
+        sobolrsg.direction_numbers(0)
+
+
+def test_joe_kuo_d5_init_arrays_by_cpp_name():
+    # values and 0 terminator of the C++ arrays in sobolrsg.cpp
+    assert sobolrsg.dim1JoeKuoD5Init.tolist() == [1, 0]
+    assert sobolrsg.dim13JoeKuoD5Init.tolist() == [1, 3, 3, 13, 9, 53, 0]
+    assert memoryview(sobolrsg.dim13JoeKuoD5Init).itemsize == 4
+    assert getattr(sobolrsg, f"dim{sobolrsg.MAX_DIMENSIONALITY - 1}JoeKuoD5Init")[-1] == 0
+    sobolrsg.dim5JoeKuoD5Init[0] = 999
+    assert sobolrsg.dim5JoeKuoD5Init.tolist() == [1, 1, 3, 3, 0]
+    with pytest.raises(AttributeError):
+        getattr(sobolrsg, f"dim{sobolrsg.MAX_DIMENSIONALITY}JoeKuoD5Init")
+
+
+@pytest.mark.parametrize("first", [1, 2, 7, 4096, (1 << 32) - 3])
+def test_trailing_zeros_range(first):
+    expected = [(v & -v).bit_length() - 1 for v in range(first, first + 5000)]
+    assert np.array_equal(sobolrsg.trailing_zeros_range(first, 5000), expected)
+    assert len(sobolrsg.trailing_zeros_range(first, 0)) == 0
+
+
+def test_draw_across_point_tiles(gray_code_kernel):
+    """Batches longer than one tile of the Numba kernels continue the sequence across tiles."""
+    sequences = 2 * sobolrsg.POINT_TILE + 77
+    one_at_a_time = SobolRsg(3)
+    expected = np.array([one_at_a_time.next_int32_sequence() for _ in range(sequences + 1)])
+
+    batched = SobolRsg(3)
+    assert np.array_equal(batched.draw_int32(sequences), expected[:-1])
+    assert np.array_equal(batched.draw(1)[0], expected[-1] * sobolrsg.NORMALIZATION_FACTOR)
+    assert np.array_equal(SobolRsg(3).draw(sequences), expected[:-1] * sobolrsg.NORMALIZATION_FACTOR)
+
+
+def test_skip_to_matches_draws():
+    rsg = SobolRsg(7)
+    draws = rsg.draw_int32(40)
+    for n in [0, 1, 2, 15, 16, 39]:
+        assert np.array_equal(SobolRsg(7).skip_to(n), draws[n])
+
+
+@pytest.mark.parametrize("use_gray_code", [True, False])
+def test_skip_to_bounds(use_gray_code):
+    rsg = SobolRsg(5, use_gray_code)
+    # N = 2^32 - 1: Gray code 0x80000000 selects the last direction integer alone
+    expected = rsg._directions[sobolrsg.BITS - 1, :5] if use_gray_code else np.bitwise_xor.reduce(rsg._directions[:, :5])
+    assert np.array_equal(rsg.skip_to(sobolrsg.MAX_SEQUENCE_COUNTER), expected)
+    for skip in [-1, sobolrsg.MAX_SEQUENCE_COUNTER + 1, 1 << 40]:
+        with pytest.raises(ValueError):
+            rsg.skip_to(skip)
+
+
+def test_without_gray_code_same_points_per_cycle():
+    """Gray code only reorders the points within each cycle of 2^j points."""
+    with_gray = SobolRsg(10).draw_int32(63)
+    # without Gray code the first point is drawn twice, as in the C++ implementation
+    without_gray = SobolRsg(10, use_gray_code=False).draw_int32(64)[1:]
+    assert np.array_equal(np.sort(with_gray, axis=0), np.sort(without_gray, axis=0))
+
+
+def test_draw_without_gray_code_matches_next_sequence():
+    one_at_a_time = SobolRsg(13, use_gray_code=False)
+    expected = np.array([one_at_a_time.next_int32_sequence() for _ in range(300)])
+    batched = SobolRsg(13, use_gray_code=False)
+    assert np.array_equal(np.vstack([batched.draw_int32(1), batched.draw_int32(299)]), expected)
+
+
+def test_generators_share_one_direction_table():
+    assert np.shares_memory(SobolRsg(3)._directions, SobolRsg(40)._directions)
+
+
+def test_share_direction_integers():
+    name = f"quasarquant_test_{os.getpid()}"
+    expected = SobolRsg(11).draw(50)
+    sobolrsg.share_direction_integers(name)
+    try:
+        assert np.array_equal(SobolRsg(11).draw(50), expected)
+        # another process attaches to the block instead of building its own table
+        child = subprocess.run(
+            [sys.executable, "-c",
+             "import numpy as np, sobolrsg; "
+             f"sobolrsg.share_direction_integers({name!r}); "
+             "assert not sobolrsg._shared_directions[2]; "
+             "print(sobolrsg.SobolRsg(11).draw(50).sum().hex())"],
+            cwd=SCRIPT_DIR.parent, capture_output=True, text=True, check=True)
+        assert child.stdout.strip() == expected.sum().hex()
+    finally:
+        sobolrsg.release_shared_direction_integers()
+    assert sobolrsg.bit_major_directions() is sobolrsg._local_bit_major_directions()
+
+
+def test_shared_direction_integers_unlinked_at_exit():
+    name = f"quasarquant_test_exit_{os.getpid()}"
+    child = subprocess.run(
+        [sys.executable, "-c", f"import sobolrsg; sobolrsg.share_direction_integers({name!r})"],
+        cwd=SCRIPT_DIR.parent, capture_output=True, text=True, check=True)
+    # no leak reported by the resource tracker, and the name is free again
+    assert "leaked" not in child.stderr
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+
+def test_generators_outlive_release_of_shared_direction_integers():
+    expected = SobolRsg(5).draw(20)
+    sobolrsg.share_direction_integers(f"quasarquant_test_release_{os.getpid()}")
+    rsg = SobolRsg(5)
+    table = sobolrsg.bit_major_directions()
+    sobolrsg.release_shared_direction_integers()
+    gc.collect()
+    # the views still read the released block, which is only unmapped once they are gone
+    assert np.array_equal(rsg.draw(20), expected)
+    assert np.array_equal(table, sobolrsg.bit_major_directions())
+
+
+def test_invalid_dimensionality():
+    with pytest.raises(ValueError):
+        SobolRsg(0)
+    with pytest.raises(ValueError):
+        SobolRsg(sobolrsg.MAX_DIMENSIONALITY + 1)
+
+
+@pytest.mark.parametrize("use_gray_code", [True, False])
+def test_draw_into_preallocated_array(gray_code_kernel, use_gray_code):
+    expected = SobolRsg(6, use_gray_code)
+    rsg = SobolRsg(6, use_gray_code)
+    integers = np.empty((40, 6), dtype=np.uint32)
+    points = np.empty((40, 6), dtype=np.float32)
+    normals = np.empty((40, 6))
+    for _ in range(3):
+        assert rsg.draw_int32(40, out=integers) is integers
+        assert np.array_equal(integers, expected.draw_int32(40))
+        assert rsg.draw(40, dtype=np.float32, out=points) is points
+        assert np.array_equal(points, expected.draw(40, dtype=np.float32))
+        assert rsg.draw_normal(40, out=normals) is normals
+        assert np.array_equal(normals, expected.draw_normal(40))
+
+    with pytest.raises(ValueError):
+        rsg.draw(40, out=points)
+    with pytest.raises(ValueError):
+        rsg.draw_int32(39, out=integers)
+    normals.flags.writeable = False
+    with pytest.raises(ValueError):
+        rsg.draw_normal(40, out=normals)
+    # the failed draws did not move the sequence
+    assert np.array_equal(rsg.draw_int32(40), expected.draw_int32(40))
+
+
+def test_draw_float32(gray_code_kernel):
+    expected = SobolRsg(9).draw_int32(300) >> 8
+    rsg = SobolRsg(9)
+    points = np.vstack([rsg.draw(100, dtype=np.float32), rsg.draw(200, dtype=np.float32)])
+    assert points.dtype == np.float32
+    assert np.array_equal(points * np.float32(1 << 24), expected)
+    assert points.max() < 1.0
+
+    with pytest.raises(ValueError):
+        SobolRsg(9).draw(10, dtype=np.float16)
+
+
+def reference_inverse_cumulative_normal(x):
+    """InverseCumulativeNormal::standard_value() from normaldistribution.hpp/.cpp."""
+    a, b = sobolrsg._ICN_A, sobolrsg._ICN_B
+    c, d = sobolrsg._ICN_C, sobolrsg._ICN_D
+    if 0.02425 <= x <= 1.0 - 0.02425:
+        z = x - 0.5
+        r = z * z
+        return ((((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * z /
+                (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1.0))
+    z = math.sqrt(-2.0 * math.log(x if x < 0.5 else 1.0 - x))
+    z = ((((((c[0] * z + c[1]) * z + c[2]) * z + c[3]) * z + c[4]) * z + c[5]) /
+         ((((d[0] * z + d[1]) * z + d[2]) * z + d[3]) * z + 1.0))
+    return z if x < 0.5 else -z
+
+
+def test_inverse_cumulative_normal():
+    x = np.concatenate([[2.0 ** -32, 1e-10, 0.0242, 0.02425, 0.3, 0.5, 0.97575, 0.9758, 1.0 - 2.0 ** -32],
+                        np.random.default_rng(7).random(1000)])
+    expected = [reference_inverse_cumulative_normal(v) for v in x]
+    np.testing.assert_allclose(sobolrsg.inverse_cumulative_normal(x), expected, rtol=1e-14)
+
+
+@pytest.mark.parametrize("use_gray_code", [True, False])
+def test_draw_normal(gray_code_kernel, use_gray_code):
+    uniforms = SobolRsg(21, use_gray_code).draw(2 * sobolrsg.POINT_TILE + 5)
+    expected = sobolrsg.inverse_cumulative_normal(uniforms)
+    rsg = SobolRsg(21, use_gray_code)
+    normals = np.vstack([rsg.draw_normal(100), rsg.draw_normal(len(uniforms) - 100)])
+    np.testing.assert_allclose(normals, expected, rtol=1e-14, atol=1e-15)
+    assert np.array_equal(rsg.last_sequence(), uniforms[-1])
+    assert np.array_equal(rsg.draw(1), SobolRsg(21, use_gray_code).draw(len(uniforms) + 1)[-1:])
+
+    single = SobolRsg(21, use_gray_code).draw_normal(300, dtype=np.float32)
+    assert single.dtype == np.float32
+    np.testing.assert_allclose(single, expected[:300], rtol=1e-6, atol=1e-7)
+
+
+def test_draw_cuda_falls_back_to_cpu_without_cupy(monkeypatch):
+    monkeypatch.setattr(sobolrsg, "cupy", None)
+    points = SobolRsg(5).draw_cuda(17)
+    assert points.dtype == np.float32
+    assert np.array_equal(points, SobolRsg(5).draw(17, dtype=np.float32))
+
+
+@pytest.mark.parametrize("use_gray_code", [True, False])
+def test_advance_batch(use_gray_code):
+    """The counters draw_cuda() hands to the device kernel, and the state it leaves."""
+    expected = SobolRsg(4, use_gray_code).draw_int32(61)
+    rsg = SobolRsg(4, use_gray_code)
+    begin = 0
+    for n in [1, 2, 9, 31, 17]:
+        first, repeat = rsg._advance_batch(n)
+        points = [SobolRsg(4, use_gray_code).skip_to(first + max(i - repeat, 0)) for i in range(n)]
+        assert np.array_equal(points, expected[begin:begin + n])
+        begin += n
+    assert np.array_equal(rsg.next_int32_sequence(), expected[begin])
+
+
+def test_joe_kuo_d5_table():
+    table, lengths = sobolrsg.joe_kuo_d5_table()
+    assert table.shape == (sobolrsg.MAX_DIMENSIONALITY - 1, max(lengths))
+    assert table.dtype == np.uint16
+    # the loaded asset against a fresh parse of sobolrsg.cpp and primitivepolynomials.cpp
+    parsed = sobolrsg.parse_joe_kuo_d5_sources()
+    assert np.array_equal(table, parsed["init"])
+    assert np.array_equal(lengths, parsed["degree"])
+    # dim1JoeKuoD5Init, dim2JoeKuoD5Init and dim13JoeKuoD5Init in sobolrsg.cpp, without the 0 terminator
+    for dimension, expected in [(1, [1]), (2, [1, 3]), (13, [1, 3, 3, 13, 9, 53])]:
+        assert table[dimension - 1, :lengths[dimension - 1]].tolist() == expected
+        assert not table[dimension - 1, lengths[dimension - 1]:].any()